@@ -10,7 +10,7 @@ import time
 from pathlib import Path
 from typing import Any
 
-from .converters.geoparquet_converter import GeoParquetConverter
+from .converters.geoparquet_converter import COMPRESSIONS, WRITER_MODES, GeoParquetConverter
 from .exceptions import ConversionError, ESRIConverterError, ValidationError
 
 
@@ -21,6 +21,12 @@ def convert_gdb_to_parquet(
     chunk_size: int = 15000,
     show_progress: bool = True,
     log_file: str | None = None,
+    writer_mode: str = "record_batch",
+    use_arrow: bool = False,
+    row_group_size: int | None = None,
+    compression: str = "zstd",
+    use_dictionary: bool = True,
+    gdb_info: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Convert a File Geodatabase (GDB) to OGC GeoParquet format.
@@ -31,9 +37,25 @@ def convert_gdb_to_parquet(
         gdb_path: Path to the .gdb file or directory
         output_dir: Directory to save output files (default: "geoparquet_output")
         layers: List of specific layers to convert (default: all layers)
-        chunk_size: Number of records to process at once (default: 15000)
+        chunk_size: Number of records to process at once (default: 15000). With the
+            buffered "record_batch" writer this is a flush threshold, not a point
+            where output buffers are reallocated.
         show_progress: Whether to show Rich progress bars (default: True)
         log_file: Optional log file path (default: None)
+        writer_mode: How streamed chunks are written (default: "record_batch").
+            "record_batch" streams each chunk into one open ParquetWriter;
+            "table" concatenates all chunks in memory and writes once.
+        use_arrow: Stream layers as Arrow record batches of chunk_size rows with
+            pyogrio (>=0.8), skipping per-row Python objects. Falls back to the
+            Fiona reader when pyogrio is not installed (default: False)
+        row_group_size: Number of rows per Parquet row group, independent of the
+            read chunk size (default: chunk_size)
+        compression: Parquet compression codec, one of "snappy", "zstd" or "lz4"
+            (default: "zstd", written at level 3)
+        use_dictionary: Whether to dictionary-encode columns (default: True)
+        gdb_info: Result of a previous get_gdb_info() call for the same GDB; its
+            layer list and record counts are reused instead of re-scanning each
+            layer (default: None)
 
     Returns:
         Dictionary containing conversion results:
@@ -73,6 +95,27 @@ def convert_gdb_to_parquet(
     if not gdb_path.name.endswith(".gdb"):
         raise ValidationError(f"Path is not a .gdb file: {gdb_path}")
 
+    if writer_mode not in WRITER_MODES:
+        raise ValidationError(
+            f"Invalid writer mode: {writer_mode}. Expected one of: {', '.join(WRITER_MODES)}",
+            field="writer_mode",
+            value=writer_mode,
+        )
+
+    if row_group_size is not None and row_group_size <= 0:
+        raise ValidationError(
+            f"Row group size must be positive: {row_group_size}",
+            field="row_group_size",
+            value=row_group_size,
+        )
+
+    if compression not in COMPRESSIONS:
+        raise ValidationError(
+            f"Invalid compression: {compression}. Expected one of: {', '.join(COMPRESSIONS)}",
+            field="compression",
+            value=compression,
+        )
+
     # Set up output directory
     if output_dir is None:
         output_dir = Path("geoparquet_output")
@@ -89,11 +132,22 @@ def convert_gdb_to_parquet(
 
     try:
         # Initialize converter
-        converter = GeoParquetConverter(str(output_dir))
+        converter = GeoParquetConverter(
+            str(output_dir),
+            compression=compression,
+            use_dictionary=use_dictionary,
+            show_progress=show_progress,
+        )
 
         # Perform conversion
         result = converter.convert_gdb_geoparquet(
-            str(gdb_path), layers=layers, chunk_size=chunk_size
+            str(gdb_path),
+            layers=layers,
+            chunk_size=chunk_size,
+            writer_mode=writer_mode,
+            use_arrow=use_arrow,
+            row_group_size=row_group_size,
+            gdb_info=gdb_info,
         )
 
         # Check for errors
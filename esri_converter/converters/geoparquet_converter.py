@@ -7,15 +7,17 @@ Produces valid GeoParquet files according to the OGC GeoParquet specification.
 import json
 import logging
 import os
+import re
 import tempfile
 import time
 import warnings
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import fiona
 import geopandas as gpd
-import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 from rich import box
 
@@ -36,9 +38,35 @@ from rich.table import Table
 from rich.text import Text
 from shapely.geometry import shape
 
+from ..exceptions import SchemaError
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
+# Supported strategies for writing streamed chunks to disk
+WRITER_MODES = ("record_batch", "table")
+
+# Parquet compression codecs exposed to callers
+COMPRESSIONS = ("snappy", "zstd", "lz4")
+
+# Arrow types for Fiona property types; Fiona returns dates and times as strings
+FIONA_ARROW_TYPES = {
+    "str": pa.string(),
+    "int": pa.int64(),
+    "int64": pa.int64(),
+    "int32": pa.int32(),
+    "int16": pa.int16(),
+    "float": pa.float64(),
+    "bool": pa.bool_(),
+    "bytes": pa.binary(),
+    "date": pa.string(),
+    "time": pa.string(),
+    "datetime": pa.string(),
+}
+
+# Oldest pyogrio release whose raw.open_arrow can yield a pyarrow RecordBatchReader
+PYOGRIO_ARROW_MIN_VERSION = (0, 8)
+
 # Suppress GDAL/OGR warnings about complex polygons
 os.environ["CPL_LOG"] = "/dev/null"
 os.environ["GDAL_DISABLE_READDIR_ON_OPEN"] = "EMPTY_DIR"
@@ -64,14 +92,88 @@ logging.getLogger("fiona.ogrext").setLevel(logging.ERROR)
 logging.getLogger("fiona._env").setLevel(logging.ERROR)
 
 
+def pyogrio_arrow_available() -> bool:
+    """Check whether pyogrio's Arrow reader can be used."""
+    try:
+        import pyogrio
+    except ImportError:
+        return False
+
+    match = re.match(r"(\d+)\.(\d+)", getattr(pyogrio, "__version__", ""))
+    if not match:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= PYOGRIO_ARROW_MIN_VERSION
+
+
+def fiona_arrow_type(fiona_type: str) -> pa.DataType:
+    """Map a Fiona property type such as ``"str:254"`` to an Arrow type."""
+    return FIONA_ARROW_TYPES.get(fiona_type.split(":")[0], pa.string())
+
+
+def geoparquet_geometry_types(geometry_type: str | None) -> list[str]:
+    """Translate an OGR geometry type name to GeoParquet ``geometry_types``."""
+    if not geometry_type or geometry_type in ("Unknown", "Any", "None"):
+        return []
+    if geometry_type.startswith("3D "):
+        return [f"{geometry_type[3:]} Z"]
+    return [geometry_type]
+
+
+def geoparquet_metadata(
+    geometry_type: str | None, crs: Any, bounds: tuple[float, float, float, float] | None = None
+) -> dict[str, Any]:
+    """Build GeoParquet ``geo`` metadata for a layer's WKB ``geometry`` column."""
+    column_metadata: dict[str, Any] = {
+        "encoding": "WKB",
+        "geometry_types": geoparquet_geometry_types(geometry_type),
+    }
+
+    if crs:
+        from pyproj import CRS
+
+        column_metadata["crs"] = CRS.from_user_input(crs).to_json_dict()
+    else:
+        column_metadata["crs"] = None
+
+    if bounds:
+        column_metadata["bbox"] = list(bounds)
+
+    return {
+        "version": "1.0.0",
+        "primary_column": "geometry",
+        "columns": {"geometry": column_metadata},
+    }
+
+
 class GeoParquetConverter:
     """Converter that produces OGC GeoParquet-compliant files."""
 
-    def __init__(self, output_dir: str = "geoparquet_output"):
-        """Initialize the converter."""
+    def __init__(
+        self,
+        output_dir: str = "geoparquet_output",
+        compression: str = "zstd",
+        use_dictionary: bool = True,
+        show_progress: bool = True,
+    ):
+        """Initialize the converter.
+
+        With ``show_progress=False`` banners, tables, progress bars and success
+        panels are suppressed; warnings and errors are still logged.
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.console = console
+        self.show_progress = show_progress
+        self.console = console if show_progress else Console(quiet=True)
+
+        # Options shared by every Parquet write
+        self.parquet_options: dict[str, Any] = {
+            "compression": compression,
+            "use_dictionary": use_dictionary,
+            "data_page_size": 1 << 20,
+            "write_statistics": True,
+        }
+        if compression == "zstd":
+            self.parquet_options["compression_level"] = 3
 
         # Additional GDAL warning suppression
         self._configure_gdal_warnings()
@@ -161,51 +263,104 @@ class GeoParquetConverter:
             raise
 
     def convert_layer_geoparquet(
-        self, gdb_path: str, layer_name: str, output_path: str, chunk_size: int = 15000
+        self,
+        gdb_path: str,
+        layer_name: str,
+        output_path: str,
+        chunk_size: int = 15000,
+        writer_mode: str = "record_batch",
+        use_arrow: bool = False,
+        row_group_size: int | None = None,
+        layer_info: dict[str, Any] | None = None,
     ) -> bool:
-        """Convert layer to proper GeoParquet format."""
-
-        with self.console.status(f"[bold green]Analyzing layer '{layer_name}'..."):
-            try:
-                with fiona.open(gdb_path, layer=layer_name) as src:
-                    total_records = len(src)
-                    schema = src.schema
-                    crs = src.crs
-                    bounds = src.bounds
-            except Exception as e:
-                logger.error(f"Failed to analyze layer: {e}")
-                return False
+        """Convert layer to proper GeoParquet format.
+
+        ``chunk_size`` bounds how many records are read into memory at once, while
+        ``row_group_size`` sets the on-disk row group layout (defaults to
+        ``chunk_size``). A ``layer_info`` entry from ``get_gdb_info`` skips the
+        analysis pass over the layer.
+        """
+        row_group_size = row_group_size or chunk_size
+
+        # The Arrow path takes layer metadata from pyogrio, so skip the Fiona pass
+        if use_arrow:
+            if pyogrio_arrow_available():
+                return self._convert_arrow_geoparquet(
+                    gdb_path, layer_name, output_path, chunk_size, row_group_size, layer_info
+                )
+            logger.warning(
+                "pyogrio>=%s.%s not installed, falling back to Fiona reader",
+                *PYOGRIO_ARROW_MIN_VERSION,
+            )
 
-        # Show layer info
-        info_table = Table(title=f"Layer: {layer_name}")
-        info_table.add_column("Property", style="cyan")
-        info_table.add_column("Value", style="white")
+        if layer_info and "error" not in layer_info:
+            total_records = layer_info["record_count"]
+            geometry_type = layer_info["geometry_type"]
+            crs = layer_info["crs"] if layer_info["crs"] != "Unknown" else None
+            field_count = layer_info["field_count"]
+            bounds = tuple(layer_info["bounds"]) if layer_info.get("bounds") else None
+        else:
+            with self.console.status(f"[bold green]Analyzing layer '{layer_name}'..."):
+                try:
+                    with fiona.open(gdb_path, layer=layer_name) as src:
+                        total_records = len(src)
+                        schema = src.schema
+                        crs = src.crs
+                        bounds = src.bounds
+                except Exception as e:
+                    logger.error(f"Failed to analyze layer: {e}")
+                    return False
 
-        info_table.add_row("Records", f"{total_records:,}")
-        info_table.add_row("Geometry Type", schema.get("geometry", "Unknown"))
-        info_table.add_row("CRS", str(crs) if crs else "Unknown")
-        info_table.add_row("Fields", str(len(schema.get("properties", {}))))
-        info_table.add_row("Bounds", f"{bounds}" if bounds else "Unknown")
+            geometry_type = schema.get("geometry", "Unknown")
+            field_count = len(schema.get("properties", {}))
 
-        self.console.print(info_table)
-        self.console.print()
+        self._show_layer_info(layer_name, total_records, geometry_type, crs, field_count, bounds)
 
         # Determine processing method
         if total_records <= chunk_size:
             return self._convert_direct_geoparquet(
-                gdb_path, layer_name, output_path, total_records, crs
+                gdb_path, layer_name, output_path, total_records, crs, row_group_size, bounds
             )
         else:
             return self._convert_streaming_geoparquet(
-                gdb_path, layer_name, output_path, chunk_size, total_records, crs
+                gdb_path,
+                layer_name,
+                output_path,
+                chunk_size,
+                total_records,
+                crs,
+                bounds=bounds,
+                writer_mode=writer_mode,
+                row_group_size=row_group_size,
             )
 
-    def _convert_direct_geoparquet(
-        self, gdb_path: str, layer_name: str, output_path: str, total_records: int, crs: Any
-    ) -> bool:
-        """Direct conversion to GeoParquet."""
+    def _show_layer_info(
+        self,
+        layer_name: str,
+        total_records: int | None,
+        geometry_type: str | None,
+        crs: Any,
+        field_count: int,
+        bounds: tuple[float, float, float, float] | None,
+    ) -> None:
+        """Show a summary table for the layer about to be converted."""
+        info_table = Table(title=f"Layer: {layer_name}")
+        info_table.add_column("Property", style="cyan")
+        info_table.add_column("Value", style="white")
+
+        records = f"{total_records:,}" if total_records is not None else "Unknown"
+        info_table.add_row("Records", records)
+        info_table.add_row("Geometry Type", geometry_type or "Unknown")
+        info_table.add_row("CRS", str(crs) if crs else "Unknown")
+        info_table.add_row("Fields", str(field_count))
+        info_table.add_row("Bounds", f"{bounds}" if bounds else "Unknown")
+
+        self.console.print(info_table)
+        self.console.print()
 
-        with Progress(
+    def _progress(self) -> Progress:
+        """Create the progress display shared by every conversion path."""
+        return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -213,13 +368,51 @@ class GeoParquetConverter:
             TimeElapsedColumn(),
             TimeRemainingColumn(),
             console=self.console,
-        ) as progress:
+        )
+
+    def _show_success(
+        self,
+        message: str,
+        records: int,
+        elapsed: float,
+        output_path: str,
+        crs: Any,
+        detail: str | None = None,
+    ) -> None:
+        """Show the success panel for a converted layer."""
+        output_size = Path(output_path).stat().st_size / (1024 * 1024)
+
+        success_text = Text()
+        success_text.append(f"✅ {message}", style="bold green")
+        success_text.append(f"\n📊 {records:,} records processed in {elapsed:.2f}s")
+        if detail:
+            success_text.append(f"\n{detail}")
+        success_text.append(f"\n💾 Output: {output_size:.2f} MB")
+        success_text.append(f"\n⚡ Rate: {records / elapsed:,.0f} records/second")
+        success_text.append(f"\n🗺️  CRS: {crs}")
+
+        self.console.print(Panel(success_text, title="Success", border_style="green"))
+
+    def _convert_direct_geoparquet(
+        self,
+        gdb_path: str,
+        layer_name: str,
+        output_path: str,
+        total_records: int,
+        crs: Any,
+        row_group_size: int | None = None,
+        bounds: tuple[float, float, float, float] | None = None,
+    ) -> bool:
+        """Direct conversion to GeoParquet."""
+
+        with self._progress() as progress:
             task = progress.add_task(f"Converting {layer_name} (direct)", total=total_records)
             start_time = time.time()
 
             try:
                 # Read all features
                 with fiona.open(gdb_path, layer=layer_name) as src:
+                    fiona_schema = src.schema
                     all_data = []
                     for i, feature in enumerate(src):
                         all_data.append(feature)
@@ -237,24 +430,23 @@ class GeoParquetConverter:
 
                 # Save as GeoParquet
                 save_task = progress.add_task("Writing GeoParquet...", total=1)
-                gdf.to_parquet(output_path, compression="snappy")
+                table = self._combine_layer_tables(
+                    [self._geodataframe_to_arrow(gdf)], fiona_schema, crs, bounds
+                )
+                pq.write_table(
+                    table, output_path, row_group_size=row_group_size, **self.parquet_options
+                )
                 progress.update(save_task, advance=1)
 
                 elapsed = time.time() - start_time
-                output_size = Path(output_path).stat().st_size / (1024 * 1024)
 
                 # Verify it's a valid GeoParquet
-                self._verify_geoparquet(output_path)
-
-                # Success message
-                success_text = Text()
-                success_text.append("✅ GeoParquet conversion completed!", style="bold green")
-                success_text.append(f"\n📊 {total_records:,} records processed in {elapsed:.2f}s")
-                success_text.append(f"\n💾 Output: {output_size:.2f} MB")
-                success_text.append(f"\n⚡ Rate: {total_records / elapsed:,.0f} records/second")
-                success_text.append(f"\n🗺️  CRS: {crs}")
+                if not self._verify_geoparquet(output_path):
+                    return False
 
-                self.console.print(Panel(success_text, title="Success", border_style="green"))
+                self._show_success(
+                    "GeoParquet conversion completed!", len(all_data), elapsed, output_path, crs
+                )
                 return True
 
             except Exception as e:
@@ -269,18 +461,30 @@ class GeoParquetConverter:
         chunk_size: int,
         total_records: int,
         crs: Any,
+        bounds: tuple[float, float, float, float] | None = None,
+        writer_mode: str = "record_batch",
+        row_group_size: int | None = None,
     ) -> bool:
-        """Streaming conversion to GeoParquet with chunk processing."""
+        """Streaming conversion to GeoParquet with chunk processing.
+
+        With ``writer_mode="record_batch"`` each processed chunk is streamed into a
+        single open ``ParquetWriter`` and flushed in row groups of ``row_group_size``
+        rows, independent of ``chunk_size``. ``writer_mode="table"`` keeps the legacy behaviour
+        of concatenating every chunk in memory and writing the file in one go.
+        """
+        if writer_mode == "record_batch":
+            return self._convert_streaming_record_batches(
+                gdb_path,
+                layer_name,
+                output_path,
+                chunk_size,
+                total_records,
+                crs,
+                bounds=bounds,
+                row_group_size=row_group_size,
+            )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-            console=self.console,
-        ) as progress:
+        with self._progress() as progress:
             main_task = progress.add_task(
                 f"Converting {layer_name} (streaming)", total=total_records
             )
@@ -289,75 +493,61 @@ class GeoParquetConverter:
             try:
                 with tempfile.TemporaryDirectory():
                     with fiona.open(gdb_path, layer=layer_name) as src:
-                        chunk_gdfs = []
+                        fiona_schema = src.schema
+                        chunk_tables: list[pa.Table] = []
                         processed_records = 0
-                        chunk_data = []
 
-                        for i, feature in enumerate(src):
-                            chunk_data.append(feature)
-
-                            # Update main progress
-                            if (i + 1) % 1000 == 0:
-                                progress.update(main_task, completed=i + 1)
-
-                            if len(chunk_data) >= chunk_size or i == total_records - 1:
-                                # Process chunk
-                                chunk_task = progress.add_task(
-                                    f"Processing chunk {len(chunk_gdfs) + 1}", total=len(chunk_data)
-                                )
-
-                                gdf_chunk = self._process_chunk_geoparquet(
-                                    chunk_data, crs, progress, chunk_task
-                                )
-                                chunk_gdfs.append(gdf_chunk)
-                                progress.remove_task(chunk_task)
+                        for chunk_data in self._iter_feature_chunks(src, chunk_size):
+                            # Process chunk
+                            chunk_task = progress.add_task(
+                                f"Processing chunk {len(chunk_tables) + 1}", total=len(chunk_data)
+                            )
 
-                                processed_records += len(chunk_data)
-                                progress.update(main_task, completed=processed_records)
+                            gdf_chunk = self._process_chunk_geoparquet(
+                                chunk_data, crs, progress, chunk_task
+                            )
+                            chunk_tables.append(self._geodataframe_to_arrow(gdf_chunk))
+                            progress.remove_task(chunk_task)
 
-                                chunk_data = []
+                            processed_records += len(chunk_data)
+                            progress.update(main_task, completed=processed_records)
 
                         # Combine chunks
-                        if chunk_gdfs:
+                        if chunk_tables:
                             combine_task = progress.add_task(
-                                "Combining chunks...", total=len(chunk_gdfs)
+                                "Combining chunks...", total=len(chunk_tables)
                             )
 
-                            # Concatenate all GeoDataFrames
-                            combined_gdf = pd.concat(chunk_gdfs, ignore_index=True)
-                            # Ensure it's a proper GeoDataFrame with correct CRS
-                            combined_gdf = gpd.GeoDataFrame(combined_gdf, crs=crs)
+                            # Concatenate all chunks under the layer's declared types
+                            combined_table = self._combine_layer_tables(
+                                chunk_tables, fiona_schema, crs, bounds
+                            )
 
-                            progress.update(combine_task, advance=len(chunk_gdfs))
+                            progress.update(combine_task, advance=len(chunk_tables))
 
                             # Save as GeoParquet
                             save_task = progress.add_task("Writing GeoParquet...", total=1)
-                            combined_gdf.to_parquet(output_path, compression="snappy")
+                            pq.write_table(
+                                combined_table,
+                                output_path,
+                                row_group_size=row_group_size,
+                                **self.parquet_options,
+                            )
                             progress.update(save_task, advance=1)
 
                             elapsed = time.time() - start_time
-                            output_size = Path(output_path).stat().st_size / (1024 * 1024)
 
                             # Verify it's a valid GeoParquet
-                            self._verify_geoparquet(output_path)
-
-                            # Success message
-                            success_text = Text()
-                            success_text.append(
-                                "✅ GeoParquet streaming conversion completed!", style="bold green"
-                            )
-                            success_text.append(
-                                f"\n📊 {processed_records:,} records processed in {elapsed:.2f}s"
-                            )
-                            success_text.append(f"\n🗂️  {len(chunk_gdfs)} chunks combined")
-                            success_text.append(f"\n💾 Output: {output_size:.2f} MB")
-                            success_text.append(
-                                f"\n⚡ Rate: {processed_records / elapsed:,.0f} records/second"
-                            )
-                            success_text.append(f"\n🗺️  CRS: {crs}")
-
-                            self.console.print(
-                                Panel(success_text, title="Success", border_style="green")
+                            if not self._verify_geoparquet(output_path):
+                                return False
+
+                            self._show_success(
+                                "GeoParquet streaming conversion completed!",
+                                processed_records,
+                                elapsed,
+                                output_path,
+                                crs,
+                                detail=f"🗂️  {len(chunk_tables)} chunks combined",
                             )
                             return True
                         else:
@@ -368,32 +558,353 @@ class GeoParquetConverter:
                 logger.error(f"Streaming conversion failed: {e}")
                 return False
 
-    def _verify_geoparquet(self, file_path: str) -> bool:
-        """Verify that the output is a valid GeoParquet file."""
+    def _convert_streaming_record_batches(
+        self,
+        gdb_path: str,
+        layer_name: str,
+        output_path: str,
+        chunk_size: int,
+        total_records: int,
+        crs: Any,
+        bounds: tuple[float, float, float, float] | None = None,
+        row_group_size: int | None = None,
+    ) -> bool:
+        """Streaming conversion that writes each chunk through one open ParquetWriter."""
+        row_group_size = row_group_size or chunk_size
+
+        with self._progress() as progress:
+            main_task = progress.add_task(
+                f"Converting {layer_name} (streaming)", total=total_records
+            )
+            start_time = time.time()
+            writer: pq.ParquetWriter | None = None
+            pending: list[pa.RecordBatch] = []
+            processed_records = 0
+            chunk_count = 0
+
+            try:
+                with fiona.open(gdb_path, layer=layer_name) as src:
+                    for chunk_data in self._iter_feature_chunks(src, chunk_size):
+                        chunk_task = progress.add_task(
+                            f"Processing chunk {chunk_count + 1}", total=len(chunk_data)
+                        )
+                        gdf_chunk = self._process_chunk_geoparquet(
+                            chunk_data, crs, progress, chunk_task
+                        )
+                        progress.remove_task(chunk_task)
+
+                        table = self._geodataframe_to_arrow(gdf_chunk)
+                        if writer is None:
+                            schema = self._layer_arrow_schema(
+                                table.schema,
+                                src.schema,
+                                geoparquet_metadata(src.schema.get("geometry"), crs, bounds),
+                            )
+                            writer = pq.ParquetWriter(output_path, schema, **self.parquet_options)
+                        pending.extend(table.cast(writer.schema).to_batches())
+                        pending = self._flush_row_groups(writer, pending, row_group_size)
+
+                        processed_records += len(chunk_data)
+                        chunk_count += 1
+                        progress.update(main_task, completed=processed_records)
+
+                if writer is None:
+                    logger.error("No chunks created")
+                    return False
+
+                # Write the final, possibly partial, row group
+                if pending:
+                    writer.write_table(
+                        pa.Table.from_batches(pending, schema=writer.schema),
+                        row_group_size=row_group_size,
+                    )
+
+                writer.close()
+                writer = None
+
+                elapsed = time.time() - start_time
+
+                # Verify it's a valid GeoParquet
+                if not self._verify_geoparquet(output_path):
+                    return False
+
+                self._show_success(
+                    "GeoParquet streaming conversion completed!",
+                    processed_records,
+                    elapsed,
+                    output_path,
+                    crs,
+                    detail=f"🗂️  {chunk_count} chunks streamed",
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"Streaming conversion failed: {e}")
+                return False
+
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    def _convert_arrow_geoparquet(
+        self,
+        gdb_path: str,
+        layer_name: str,
+        output_path: str,
+        chunk_size: int,
+        row_group_size: int,
+        layer_info: dict[str, Any] | None = None,
+    ) -> bool:
+        """Streaming conversion through pyogrio's Arrow reader.
+
+        Record batches of ``chunk_size`` rows go straight from GDAL into one open
+        ``ParquetWriter``, without per-row Python objects, so memory stays bounded
+        by ``chunk_size`` and ``row_group_size``.
+        """
+        from pyogrio import read_info
+        from pyogrio.raw import open_arrow
+
+        start_time = time.time()
+        writer: pq.ParquetWriter | None = None
+        pending: list[pa.RecordBatch] = []
+        processed_records = 0
+
         try:
-            # Check if it can be read as GeoParquet
-            gpd.read_parquet(file_path)
+            if layer_info and "error" not in layer_info:
+                total_records = layer_info["record_count"]
+                bounds = tuple(layer_info["bounds"]) if layer_info.get("bounds") else None
+            else:
+                # Feature count and extent are read from the layer header
+                info = read_info(gdb_path, layer=layer_name)
+                features = info.get("features", -1)
+                total_records = features if features >= 0 else None
+                total_bounds = info.get("total_bounds")
+                bounds = tuple(float(v) for v in total_bounds) if total_bounds is not None else None
+
+            with open_arrow(
+                gdb_path, layer=layer_name, batch_size=chunk_size, use_pyarrow=True
+            ) as (meta, reader):
+                self._show_layer_info(
+                    layer_name,
+                    total_records,
+                    meta.get("geometry_type"),
+                    meta.get("crs"),
+                    len(meta.get("fields", [])),
+                    bounds,
+                )
+
+                schema = self._arrow_geo_schema(reader.schema, meta, bounds)
+                writer = pq.ParquetWriter(output_path, schema, **self.parquet_options)
 
+                with self._progress() as progress:
+                    main_task = progress.add_task(
+                        f"Converting {layer_name} (arrow)", total=total_records
+                    )
+
+                    for batch in reader:
+                        pending.append(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+                        pending = self._flush_row_groups(writer, pending, row_group_size)
+
+                        processed_records += batch.num_rows
+                        progress.update(main_task, completed=processed_records)
+
+            # Write the final, possibly partial, row group
+            if pending:
+                writer.write_table(
+                    pa.Table.from_batches(pending, schema=schema), row_group_size=row_group_size
+                )
+
+            writer.close()
+            writer = None
+
+            elapsed = time.time() - start_time
+
+            # Verify it's a valid GeoParquet
+            if not self._verify_geoparquet(output_path):
+                return False
+
+            self._show_success(
+                "GeoParquet arrow conversion completed!",
+                processed_records,
+                elapsed,
+                output_path,
+                meta.get("crs"),
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Arrow conversion failed: {e}")
+            return False
+
+        finally:
+            if writer is not None:
+                writer.close()
+
+    @staticmethod
+    def _arrow_geo_schema(
+        schema: pa.Schema,
+        meta: dict[str, Any],
+        bounds: tuple[float, float, float, float] | None = None,
+    ) -> pa.Schema:
+        """Rename pyogrio's WKB column to ``geometry`` and attach GeoParquet metadata.
+
+        Raises:
+            SchemaError: If the layer has no geometry column (a plain attribute table)
+        """
+        geometry_name = meta.get("geometry_name") or "wkb_geometry"
+        if geometry_name not in schema.names:
+            raise SchemaError(
+                "Layer has no geometry column; convert it without use_arrow",
+                schema_info={"fields": schema.names},
+            )
+
+        # Rebuilding the geometry field also drops GDAL's GeoArrow field metadata
+        fields = [
+            pa.field("geometry", field.type) if field.name == geometry_name else field
+            for field in schema
+        ]
+        geo_metadata = geoparquet_metadata(meta.get("geometry_type"), meta.get("crs"), bounds)
+        return pa.schema(fields, metadata={b"geo": json.dumps(geo_metadata).encode("utf-8")})
+
+    @staticmethod
+    def _iter_feature_chunks(src: Any, chunk_size: int) -> Iterator[list[Any]]:
+        """Yield lists of up to ``chunk_size`` features, including the last partial one.
+
+        Chunking never relies on the layer's reported record count, which may be
+        stale when it comes from a caller-supplied ``gdb_info``.
+        """
+        chunk_data: list[Any] = []
+        for feature in src:
+            chunk_data.append(feature)
+            if len(chunk_data) >= chunk_size:
+                yield chunk_data
+                chunk_data = []
+
+        if chunk_data:
+            yield chunk_data
+
+    @staticmethod
+    def _flush_row_groups(
+        writer: pq.ParquetWriter, pending: list[pa.RecordBatch], row_group_size: int
+    ) -> list[pa.RecordBatch]:
+        """Write every full row group from ``pending`` and return the leftover batches."""
+        buffered_rows = sum(batch.num_rows for batch in pending)
+        full_rows = buffered_rows - buffered_rows % row_group_size
+        if full_rows == 0:
+            return pending
+
+        table = pa.Table.from_batches(pending, schema=writer.schema)
+        writer.write_table(table.slice(0, full_rows), row_group_size=row_group_size)
+        return table.slice(full_rows).to_batches()
+
+    @staticmethod
+    def _geodataframe_to_arrow(gdf: gpd.GeoDataFrame) -> pa.Table:
+        """Convert a GeoDataFrame to an Arrow table with WKB geometries."""
+        return pa.Table.from_pandas(gdf.to_wkb(), preserve_index=False)
+
+    @staticmethod
+    def _layer_arrow_schema(
+        chunk_schema: pa.Schema, fiona_schema: dict[str, Any], geo_metadata: dict[str, Any]
+    ) -> pa.Schema:
+        """Build the writer schema for a whole layer.
+
+        Property types come from the layer's Fiona schema rather than the first
+        chunk, where a sparse column may be entirely null and typed as ``null``.
+        """
+        declared = fiona_schema.get("properties", {})
+        fields = [
+            (
+                pa.field(field.name, fiona_arrow_type(declared[field.name]))
+                if field.name in declared
+                else field
+            )
+            for field in chunk_schema
+        ]
+        return pa.schema(fields, metadata={b"geo": json.dumps(geo_metadata).encode("utf-8")})
+
+    @classmethod
+    def _combine_layer_tables(
+        cls,
+        tables: list[pa.Table],
+        fiona_schema: dict[str, Any],
+        crs: Any,
+        bounds: tuple[float, float, float, float] | None = None,
+    ) -> pa.Table:
+        """Concatenate chunk tables cast to the layer's declared writer schema."""
+        schema = cls._layer_arrow_schema(
+            tables[0].schema,
+            fiona_schema,
+            geoparquet_metadata(fiona_schema.get("geometry"), crs, bounds),
+        )
+        return pa.concat_tables([table.cast(schema) for table in tables])
+
+    @staticmethod
+    def _written_layer_summary(file_path: str) -> tuple[int, str | None]:
+        """Return the row count and CRS recorded in a written GeoParquet footer."""
+        try:
+            metadata = pq.ParquetFile(file_path).metadata
+        except Exception:
+            return 0, None
+
+        crs = None
+        if metadata.metadata and b"geo" in metadata.metadata:
+            geo_metadata = json.loads(metadata.metadata[b"geo"].decode("utf-8"))
+            primary = geo_metadata["columns"].get(geo_metadata.get("primary_column"), {})
+            if primary.get("crs"):
+                from pyproj import CRS
+
+                crs = CRS.from_json_dict(primary["crs"]).to_string()
+
+        return metadata.num_rows, crs
+
+    def _verify_geoparquet(self, file_path: str) -> bool:
+        """Verify that the output is a valid GeoParquet file.
+
+        Only the footer is read, so verifying a streamed layer never loads its
+        rows back into memory.
+        """
+        try:
             # Check for geo metadata
             pq_file = pq.ParquetFile(file_path)
             metadata = pq_file.metadata
 
-            if metadata.metadata and b"geo" in metadata.metadata:
-                geo_metadata = json.loads(metadata.metadata[b"geo"].decode("utf-8"))
-                logger.info(f"GeoParquet metadata found: {geo_metadata.get('version', 'unknown')}")
-                return True
-            else:
+            if not metadata.metadata or b"geo" not in metadata.metadata:
                 logger.warning("No geo metadata found in parquet file")
                 return False
 
+            geo_metadata = json.loads(metadata.metadata[b"geo"].decode("utf-8"))
+
+            # The primary geometry column must exist in the written schema
+            primary_column = geo_metadata.get("primary_column")
+            if primary_column not in pq_file.schema_arrow.names:
+                logger.error(f"GeoParquet primary column '{primary_column}' not found in file")
+                return False
+
+            logger.log(
+                logging.INFO if self.show_progress else logging.DEBUG,
+                f"GeoParquet metadata found: {geo_metadata.get('version', 'unknown')}",
+            )
+            return True
+
         except Exception as e:
             logger.error(f"GeoParquet verification failed: {e}")
             return False
 
     def convert_gdb_geoparquet(
-        self, gdb_path: str, layers: list[str] | None = None, chunk_size: int = 15000
+        self,
+        gdb_path: str,
+        layers: list[str] | None = None,
+        chunk_size: int = 15000,
+        writer_mode: str = "record_batch",
+        use_arrow: bool = False,
+        row_group_size: int | None = None,
+        gdb_info: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Convert GDB to GeoParquet format."""
+        """Convert GDB to GeoParquet format.
+
+        When ``gdb_info`` (as returned by ``get_gdb_info``) is given, its layer
+        list and record counts are reused instead of re-scanning the GDB.
+        """
         gdb_path = Path(gdb_path)
 
         # Show GDB header
@@ -401,11 +912,16 @@ class GeoParquetConverter:
         gdb_panel = Panel(gdb_text, title="Processing GDB", border_style="yellow")
         self.console.print(gdb_panel)
 
-        try:
-            available_layers = fiona.listlayers(str(gdb_path))
-        except Exception as e:
-            logger.error(f"Cannot list layers: {e}")
-            return {"error": str(e)}
+        known_layers = {layer["name"]: layer for layer in (gdb_info or {}).get("layers", [])}
+
+        if known_layers:
+            available_layers = list(known_layers)
+        else:
+            try:
+                available_layers = fiona.listlayers(str(gdb_path))
+            except Exception as e:
+                logger.error(f"Cannot list layers: {e}")
+                return {"error": str(e)}
 
         if layers:
             layers_to_convert = [layer for layer in layers if layer in available_layers]
@@ -446,18 +962,19 @@ class GeoParquetConverter:
             output_file = gdb_output_dir / f"{layer_name}.parquet"
 
             success = self.convert_layer_geoparquet(
-                str(gdb_path), layer_name, str(output_file), chunk_size
+                str(gdb_path),
+                layer_name,
+                str(output_file),
+                chunk_size,
+                writer_mode=writer_mode,
+                use_arrow=use_arrow,
+                row_group_size=row_group_size,
+                layer_info=known_layers.get(layer_name),
             )
 
             if success:
-                # Get record count and CRS for results
-                try:
-                    with fiona.open(str(gdb_path), layer=layer_name) as src:
-                        record_count = len(src)
-                        crs = src.crs
-                except Exception:
-                    record_count = 0
-                    crs = None
+                # Report what was actually written, read from the Parquet footer
+                record_count, crs = self._written_layer_summary(str(output_file))
 
                 results["layers_converted"].append(
                     {
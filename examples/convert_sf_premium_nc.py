@@ -7,11 +7,15 @@ a large ESRI File Geodatabase to GeoParquet format with proper error handling
 and progress tracking.
 """
 
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import time
 
+from tqdm import tqdm
+
 # Add the parent directory to the path so we can import esri_converter
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -27,9 +31,101 @@ from esri_converter.exceptions import (
 )
 
 
-def main(gdb_path=None, output_dir=None, chunk_size=15000):
+def configure_gdal_io(use_vsi_cache=False):
+    """Set GDAL I/O config options before any GDB handle is opened.
+    
+    Options are set through the environment so worker processes inherit them;
+    VSI_CACHE* values already exported by the user are left untouched.
+    """
+    if use_vsi_cache:
+        # GDAL's VSI cache is an in-process block cache, not mmap: each open
+        # .gdbtable/.gdbtablx handle gets its own cache, dropped on close, which
+        # coalesces small reads within one pass over a table on slow disks.
+        # The size applies per handle (and per worker), so keep it modest.
+        os.environ.setdefault("VSI_CACHE", "TRUE")
+        os.environ.setdefault("VSI_CACHE_SIZE", str(16 * 1024 * 1024))
+
+
+def _convert_one_layer(gdb_path, output_dir, layer_name, options):
+    """Convert a single layer in a worker process with its own GDB handle."""
+    try:
+        return convert_gdb_to_parquet(
+            gdb_path=gdb_path,
+            output_dir=output_dir,
+            layers=[layer_name],
+            show_progress=False,
+            log_file="conversion.log",
+            **options
+        )
+    except ESRIConverterError as e:
+        # Return the failure instead of raising so the other workers keep going
+        return {
+            "success": False,
+            "error": str(e),
+            "layers_converted": [],
+            "layers_failed": [layer_name],
+            "total_records": 0,
+        }
+
+
+def convert_layers_parallel(gdb_path, output_dir, layer_names, max_workers=None,
+                            show_progress=True, **options):
+    """Convert layers one per worker process and merge the per-layer results.
+    
+    Extra keyword arguments are forwarded to ``convert_gdb_to_parquet``.
+    """
+    start_time = time.time()
+    layers_converted = []
+    layers_failed = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _convert_one_layer, str(gdb_path), output_dir, layer_name, options
+            ): layer_name
+            for layer_name in layer_names
+        }
+
+        completed = as_completed(futures)
+        if show_progress:
+            completed = tqdm(completed, total=len(futures), desc="Layers", unit="layer")
+
+        for future in completed:
+            layer_result = future.result()
+            layers_converted.extend(layer_result['layers_converted'])
+            layers_failed.extend(layer_result['layers_failed'])
+            if layer_result.get('error'):
+                print(f"   ❌ {futures[future]}: {layer_result['error']}")
+
+    total_time = time.time() - start_time
+    total_records = sum(layer['record_count'] for layer in layers_converted)
+
+    output_size_mb = 0
+    for layer in layers_converted:
+        output_file = Path(layer['output_file'])
+        if output_file.exists():
+            output_size_mb += output_file.stat().st_size / (1024 * 1024)
+
+    return {
+        "success": len(layers_failed) == 0,
+        "gdb_path": str(gdb_path),
+        "output_dir": str(Path(output_dir) / Path(gdb_path).stem),
+        "layers_converted": layers_converted,
+        "layers_failed": layers_failed,
+        "total_time": total_time,
+        "total_records": total_records,
+        "processing_rate": total_records / total_time if total_time > 0 else 0,
+        "output_size_mb": output_size_mb,
+    }
+
+
+def main(gdb_path=None, output_dir=None, chunk_size=15000, writer_mode="record_batch",
+         max_workers=1, row_group_size=None, compression="zstd", use_dictionary=True,
+         use_vsi_cache=False):
     """Main conversion function with comprehensive error handling."""
     
+    configure_gdal_io(use_vsi_cache)
+    
     print("🗺️  ESRI Converter - GDB to Parquet Example")
     print("=" * 50)
     
@@ -47,6 +143,11 @@ def main(gdb_path=None, output_dir=None, chunk_size=15000):
     print(f"📁 Input GDB: {gdb_path}")
     print(f"📂 Output Dir: {output_dir}")
     print(f"📦 Chunk Size: {chunk_size:,}")
+    print(f"🧱 Row Group Size: {row_group_size or chunk_size:,}")
+    print(f"🗜️  Compression: {compression} (dictionary: {'on' if use_dictionary else 'off'})")
+    print(f"✍️  Writer Mode: {writer_mode}")
+    print(f"🧵 Workers: {max_workers or os.cpu_count()}")
+    print(f"🗄️  VSI Block Cache: {'on' if use_vsi_cache else 'off'}")
     
     # Check if the GDB file exists
     if not gdb_path.exists():
@@ -85,13 +186,34 @@ def main(gdb_path=None, output_dir=None, chunk_size=15000):
         print(f"\n🚀 Starting conversion...")
         start_time = time.time()
         
-        result = convert_gdb_to_parquet(
-            gdb_path=gdb_path,
-            output_dir=output_dir,
-            chunk_size=chunk_size,
-            show_progress=True,
-            log_file="conversion.log"
-        )
+        options = {
+            "chunk_size": chunk_size,
+            "writer_mode": writer_mode,
+            "row_group_size": row_group_size,
+            "compression": compression,
+            "use_dictionary": use_dictionary,
+            # Reuse the analysis above instead of re-scanning every layer
+            "gdb_info": info,
+        }
+        
+        layer_names = [layer['name'] for layer in info['layers']]
+        if max_workers != 1 and len(layer_names) > 1:
+            result = convert_layers_parallel(
+                gdb_path=gdb_path,
+                output_dir=output_dir,
+                layer_names=layer_names,
+                max_workers=max_workers,
+                show_progress=True,
+                **options
+            )
+        else:
+            result = convert_gdb_to_parquet(
+                gdb_path=gdb_path,
+                output_dir=output_dir,
+                show_progress=True,
+                log_file="conversion.log",
+                **options
+            )
         
         # Step 5: Display results
         elapsed_time = time.time() - start_time
@@ -203,6 +325,15 @@ Examples:
   # Convert with custom output directory and chunk size
   python convert_sf_premium_nc.py -i "data.gdb" -o "my_output" -c 10000
   
+  # Read 15k records at a time but write 512k-row groups with ZSTD
+  python convert_sf_premium_nc.py -i "data.gdb" -c 15000 --row-group-size 524288 --compression zstd
+  
+  # Coalesce small table reads when the GDB lives on a network share
+  python convert_sf_premium_nc.py -i "/mnt/share/data.gdb" --vsi-cache
+  
+  # Convert layers in parallel, one layer per CPU core
+  python convert_sf_premium_nc.py -i "data.gdb" --workers 0
+  
   # Just get information about a GDB file
   python convert_sf_premium_nc.py -i "data.gdb" --info
         """
@@ -229,13 +360,73 @@ Examples:
         help="Chunk size for processing records (default: 15000)"
     )
     
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Rows per Parquet row group, independent of the chunk size "
+             "(default: same as chunk size)"
+    )
+    
+    parser.add_argument(
+        "--compression",
+        choices=["snappy", "zstd", "lz4"],
+        default="zstd",
+        help="Parquet compression codec (default: zstd)"
+    )
+    
+    parser.add_argument(
+        "--dictionary",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Dictionary-encode Parquet columns (default: enabled)"
+    )
+    
+    parser.add_argument(
+        "--writer-mode",
+        choices=["record_batch", "table"],
+        default="record_batch",
+        help="Stream chunks into one open Parquet writer (record_batch) or "
+             "combine them in memory first (table) (default: record_batch)"
+    )
+    
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes converting layers in parallel; "
+             "0 uses all CPU cores (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--vsi-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Enable GDAL's in-process VSI block cache (16 MiB per open table "
+             "file, per worker) to coalesce small reads on network or slow "
+             "disks (default: disabled)"
+    )
+    
+    # Deprecated alias for --vsi-cache; GDAL does not memory-map the GDB
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help=argparse.SUPPRESS
+    )
+    
     parser.add_argument(
         "--info",
         action="store_true",
         help="Show GDB information without converting"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.mmap:
+        print("⚠️  Warning: --mmap is deprecated, use --vsi-cache instead")
+        args.vsi_cache = True
+    
+    return args
 
 
 if __name__ == "__main__":
@@ -247,6 +438,14 @@ if __name__ == "__main__":
         print("❌ Error: Chunk size must be positive")
         sys.exit(1)
     
+    if args.row_group_size is not None and args.row_group_size <= 0:
+        print("❌ Error: Row group size must be positive")
+        sys.exit(1)
+    
+    if args.workers < 0:
+        print("❌ Error: Number of workers cannot be negative")
+        sys.exit(1)
+    
     if args.chunk_size > 100000:
         print("⚠️  Warning: Very large chunk size may cause memory issues")
         response = input("Continue? (y/N): ")
@@ -256,11 +455,18 @@ if __name__ == "__main__":
     
     # Run the appropriate function
     if args.info:
+        configure_gdal_io(args.vsi_cache)
         quick_info(args.input)
     else:
         exit_code = main(
             gdb_path=args.input,
             output_dir=args.output,
-            chunk_size=args.chunk_size
+            chunk_size=args.chunk_size,
+            writer_mode=args.writer_mode,
+            max_workers=args.workers or None,
+            row_group_size=args.row_group_size,
+            compression=args.compression,
+            use_dictionary=args.dictionary,
+            use_vsi_cache=args.vsi_cache
         )
         sys.exit(exit_code) 
\ No newline at end of file
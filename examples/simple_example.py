@@ -26,7 +26,8 @@ def simple_conversion(gdb_file, output_dir=None, chunk_size=15000):
         result = convert_gdb_to_parquet(
             gdb_path=gdb_file,
             output_dir=output_dir,
-            chunk_size=chunk_size
+            chunk_size=chunk_size,
+            use_arrow=True  # Uses pyogrio's Arrow reader when installed
         )
         
         # Print results
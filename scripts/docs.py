@@ -5,6 +5,7 @@ Documentation development helper script.
 This script provides convenient commands for working with the MkDocs documentation.
 """
 
+import shlex
 import subprocess
 import sys
 import argparse
@@ -14,14 +15,17 @@ def run_command(cmd, description):
     """Run a command and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        # Output goes straight to the terminal instead of being buffered
+        subprocess.run(shlex.split(cmd), check=True)
         print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed")
-        print(f"Error: {e.stderr}")
+        print(f"Error: exited with code {e.returncode}")
+        return False
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed")
+        print(f"Error: command not found: {e.filename}")
         return False
 
 def install_deps():
@@ -35,7 +39,7 @@ def serve_docs(host="127.0.0.1", port=8000):
     print(f"🚀 Starting documentation server at http://{host}:{port}")
     print("Press Ctrl+C to stop the server")
     try:
-        subprocess.run(cmd, shell=True, check=True)
+        subprocess.run(shlex.split(cmd), check=True)
     except KeyboardInterrupt:
         print("\n👋 Documentation server stopped")
 
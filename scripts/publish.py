@@ -8,6 +8,9 @@ It uses environment variables for secure credential management.
 
 import os
 import sys
+import glob
+import shlex
+import shutil
 import subprocess
 import argparse
 from pathlib import Path
@@ -16,15 +19,22 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+def split_command(cmd):
+    """Split a command line into arguments, expanding wildcards like a shell would."""
+    args = []
+    for arg in shlex.split(cmd):
+        matches = sorted(glob.glob(arg)) if any(c in arg for c in "*?[") else []
+        args.extend(matches or [arg])
+    return args
+
 def run_command(cmd, check=True):
-    """Run a shell command and return the result."""
+    """Run a command with its output streamed straight to the terminal."""
     print(f"🔧 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    try:
+        result = subprocess.run(split_command(cmd), stdout=None, stderr=None)
+    except FileNotFoundError as e:
+        result = subprocess.CompletedProcess(cmd, 127)
+        print(f"❌ Command not found: {e.filename}", file=sys.stderr)
     
     if check and result.returncode != 0:
         print(f"❌ Command failed with exit code {result.returncode}")
@@ -32,16 +42,32 @@ def run_command(cmd, check=True):
     
     return result
 
+# Directories never searched for __pycache__ when cleaning
+CLEAN_EXCLUDE = {'.venv', '.git', 'site', 'node_modules', 'build', 'dist'}
+
+def remove_pycache(path='.'):
+    """Recursively delete __pycache__ directories, skipping symlinks and excluded trees."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False) or entry.name in CLEAN_EXCLUDE:
+                continue
+            if entry.name == '__pycache__':
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                remove_pycache(entry.path)
+
 def clean_build():
     """Clean previous build artifacts."""
     print("🧹 Cleaning build artifacts...")
     
     # Remove build directories
-    for dir_name in ['build', 'dist', '*.egg-info']:
-        run_command(f"rm -rf {dir_name}", check=False)
+    for dir_name in ['build', 'dist']:
+        shutil.rmtree(dir_name, ignore_errors=True)
+    for egg_info in Path('.').glob('*.egg-info'):
+        shutil.rmtree(egg_info, ignore_errors=True)
     
     # Remove __pycache__ directories
-    run_command("find . -type d -name '__pycache__' -exec rm -rf {} +", check=False)
+    remove_pycache('.')
     
     print("✅ Build artifacts cleaned")
 
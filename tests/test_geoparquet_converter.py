@@ -0,0 +1,232 @@
+"""Tests for the GeoParquet converter's streaming writers."""
+
+import json
+
+import geopandas as gpd
+import pyarrow.parquet as pq
+import pytest
+from shapely.geometry import Point
+
+from esri_converter import ValidationError, convert_gdb_to_parquet, get_gdb_info
+
+
+@pytest.fixture
+def sparse_gdb(tmp_path):
+    """A 35-row polygon layer whose ``name`` column is null for the first 12 rows."""
+    gdf = gpd.GeoDataFrame(
+        {
+            "name": [None] * 12 + [f"parcel-{i}" for i in range(23)],
+            "value": [float(i) for i in range(35)],
+        },
+        geometry=[Point(i, i).buffer(0.1) for i in range(35)],
+        crs="EPSG:4326",
+    )
+    gdb_path = tmp_path / "sparse.gdb"
+    try:
+        gdf.to_file(gdb_path, layer="parcels", driver="OpenFileGDB")
+    except Exception as e:
+        pytest.skip(f"GDAL cannot write OpenFileGDB here: {e}")
+    return gdb_path
+
+
+@pytest.mark.parametrize("writer_mode", ["record_batch", "table"])
+def test_streaming_handles_null_first_chunk(sparse_gdb, tmp_path, writer_mode):
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, writer_mode=writer_mode
+    )
+
+    assert result["layers_failed"] == []
+    assert result["total_records"] == 35
+    assert result["layers_converted"][0]["crs"] == "EPSG:4326"
+
+    output_file = result["layers_converted"][0]["output_file"]
+    gdf = gpd.read_parquet(output_file)
+    assert len(gdf) == 35
+    assert gdf["name"].isna().sum() == 12
+    assert gdf["name"].iloc[-1] == "parcel-22"
+    assert gdf.crs.to_epsg() == 4326
+
+    geo_metadata = json.loads(pq.ParquetFile(output_file).metadata.metadata[b"geo"])
+    assert geo_metadata["columns"]["geometry"]["geometry_types"] == ["MultiPolygon"]
+
+
+def test_record_batch_writer_uses_declared_field_types(sparse_gdb, tmp_path):
+    result = convert_gdb_to_parquet(sparse_gdb, output_dir=tmp_path / "out", chunk_size=10)
+
+    schema = pq.read_schema(result["layers_converted"][0]["output_file"])
+    assert str(schema.field("name").type) == "string"
+    assert str(schema.field("value").type) == "double"
+
+
+@pytest.mark.parametrize("writer_mode", ["record_batch", "table"])
+def test_stale_gdb_info_record_count_keeps_last_chunk(sparse_gdb, tmp_path, writer_mode):
+    """An overstated record count must not drop the final partial chunk."""
+    info = get_gdb_info(sparse_gdb)
+    info["layers"][0]["record_count"] = 100
+
+    result = convert_gdb_to_parquet(
+        sparse_gdb,
+        output_dir=tmp_path / "out",
+        chunk_size=10,
+        writer_mode=writer_mode,
+        gdb_info=info,
+    )
+
+    assert result["layers_failed"] == []
+    assert result["layers_converted"][0]["record_count"] == 35
+    assert len(gpd.read_parquet(result["layers_converted"][0]["output_file"])) == 35
+
+
+def test_arrow_path_streams_batches_without_fiona(sparse_gdb, tmp_path, monkeypatch):
+    pytest.importorskip("pyogrio", minversion="0.8")
+    from esri_converter.converters import geoparquet_converter
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("Fiona should not be opened on the Arrow path")
+
+    monkeypatch.setattr(geoparquet_converter.fiona, "open", fail_open)
+
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, row_group_size=20, use_arrow=True
+    )
+
+    assert result["layers_failed"] == []
+    assert result["layers_converted"][0]["crs"] == "EPSG:4326"
+    output_file = result["layers_converted"][0]["output_file"]
+    metadata = pq.ParquetFile(output_file).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [20, 15]
+
+    gdf = gpd.read_parquet(output_file)
+    assert len(gdf) == 35
+    assert gdf["name"].isna().sum() == 12
+    assert gdf.crs.to_epsg() == 4326
+
+
+def test_show_progress_false_is_silent(sparse_gdb, tmp_path, capsys):
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, show_progress=False
+    )
+
+    assert result["layers_failed"] == []
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("writer_mode", ["record_batch", "table"])
+def test_verification_does_not_reload_output(sparse_gdb, tmp_path, monkeypatch, writer_mode):
+    from esri_converter.converters import geoparquet_converter
+
+    reads = []
+    monkeypatch.setattr(geoparquet_converter.gpd, "read_parquet", reads.append)
+
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, writer_mode=writer_mode
+    )
+
+    assert result["layers_failed"] == []
+    assert reads == []
+
+
+def test_arrow_path_fails_layer_without_geometry(tmp_path):
+    pyogrio = pytest.importorskip("pyogrio", minversion="0.8")
+    import pandas as pd
+
+    gdb_path = tmp_path / "table.gdb"
+    try:
+        pyogrio.write_dataframe(
+            pd.DataFrame({"value": [float(i) for i in range(35)]}),
+            gdb_path,
+            layer="attributes",
+            driver="OpenFileGDB",
+        )
+    except Exception as e:
+        pytest.skip(f"GDAL cannot write OpenFileGDB here: {e}")
+
+    result = convert_gdb_to_parquet(gdb_path, output_dir=tmp_path / "out", use_arrow=True)
+
+    assert result["layers_failed"] == ["attributes"]
+    assert result["layers_converted"] == []
+    assert not (tmp_path / "out" / "table" / "attributes.parquet").exists()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"chunk_size": 100},
+        {"chunk_size": 10, "writer_mode": "record_batch"},
+        {"chunk_size": 10, "writer_mode": "table"},
+        {"chunk_size": 10, "use_arrow": True},
+    ],
+)
+def test_failed_verification_fails_layer(sparse_gdb, tmp_path, monkeypatch, options):
+    from esri_converter.converters.geoparquet_converter import GeoParquetConverter
+
+    monkeypatch.setattr(GeoParquetConverter, "_verify_geoparquet", lambda self, path: False)
+
+    result = convert_gdb_to_parquet(sparse_gdb, output_dir=tmp_path / "out", **options)
+
+    assert result["layers_failed"] == ["parcels"]
+
+
+def test_direct_and_streaming_paths_write_the_same_schema(tmp_path):
+    """A small layer whose sparse column is all null keeps its declared type."""
+    gdf = gpd.GeoDataFrame(
+        {"name": [None] * 5, "value": [float(i) for i in range(5)]},
+        geometry=[Point(i, i).buffer(0.1) for i in range(5)],
+        crs="EPSG:4326",
+    )
+    gdb_path = tmp_path / "small.gdb"
+    try:
+        gdf.to_file(gdb_path, layer="parcels", driver="OpenFileGDB")
+    except Exception as e:
+        pytest.skip(f"GDAL cannot write OpenFileGDB here: {e}")
+
+    schemas = []
+    for options in (
+        {"chunk_size": 100},
+        {"chunk_size": 2, "writer_mode": "record_batch"},
+        {"chunk_size": 2, "writer_mode": "table"},
+    ):
+        result = convert_gdb_to_parquet(gdb_path, output_dir=tmp_path / "out", **options)
+        assert result["layers_failed"] == []
+        schemas.append(pq.read_schema(result["layers_converted"][0]["output_file"]))
+
+    assert str(schemas[0].field("name").type) == "string"
+    assert all(schema.equals(schemas[0], check_metadata=True) for schema in schemas)
+
+
+@pytest.mark.parametrize(("options", "codec"), [({}, "ZSTD"), ({"compression": "lz4"}, "LZ4")])
+def test_compression_reaches_parquet_footer(sparse_gdb, tmp_path, options, codec):
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, **options
+    )
+
+    metadata = pq.ParquetFile(result["layers_converted"][0]["output_file"]).metadata
+    assert metadata.row_group(0).column(0).compression == codec
+
+
+@pytest.mark.parametrize("use_dictionary", [True, False])
+def test_use_dictionary_reaches_parquet_footer(sparse_gdb, tmp_path, use_dictionary):
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, use_dictionary=use_dictionary
+    )
+
+    metadata = pq.ParquetFile(result["layers_converted"][0]["output_file"]).metadata
+    column = metadata.row_group(0).column(metadata.schema.names.index("name"))
+    assert ("RLE_DICTIONARY" in column.encodings) is use_dictionary
+
+
+def test_invalid_compression_raises(sparse_gdb, tmp_path):
+    with pytest.raises(ValidationError) as excinfo:
+        convert_gdb_to_parquet(sparse_gdb, output_dir=tmp_path / "out", compression="gzip")
+
+    assert excinfo.value.field == "compression"
+    assert excinfo.value.value == "gzip"
+
+
+def test_row_group_size_is_independent_of_chunk_size(sparse_gdb, tmp_path):
+    result = convert_gdb_to_parquet(
+        sparse_gdb, output_dir=tmp_path / "out", chunk_size=10, row_group_size=25
+    )
+
+    metadata = pq.ParquetFile(result["layers_converted"][0]["output_file"]).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [25, 10]